@@ -0,0 +1,82 @@
+# Description: Background worker running legal move, move and search jobs
+# for an analysis ChessBoard, so the Tk thread never waits on the rules.
+
+import queue
+import threading
+from XiangqiSearch import Searcher
+
+
+class AnalysisWorker:
+    """
+    Runs all work on a game in one background thread, so the Tk thread never
+    touches the game while it's in use. Jobs are run in order and their results
+    are queued for the board to collect by polling with after().
+    Legal move and search jobs submitted before cancel() are skipped or stopped,
+    moves are always made.
+    """
+    def __init__(self, game):
+        self._game = game
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        # set to cancel jobs submitted since the last cancel
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def submit(self, kind, *args):
+        """Queues a 'moves' (square), 'search' (depth) or 'move' (frm, to) job."""
+        self._jobs.put((self._stop, kind, args))
+
+    def cancel(self):
+        self._stop.set()
+        self._stop = threading.Event()
+
+    def close(self):
+        self.cancel()
+        self._jobs.put(None)
+
+    def results(self):
+        """
+        Returns (kind, args, result) for every job finished since the last call.
+        A job that raised is returned as ('error', (job kind,) + job args, message).
+        """
+        finished = []
+        while True:
+            try:
+                stop, kind, args, result = self._results.get_nowait()
+            except queue.Empty:
+                return finished
+            # drop analysis of positions that have since changed, moves and their errors are always kept
+            if kind == 'move' or kind == 'error' and args[0] == 'move' or not stop.is_set():
+                finished.append((kind, args, result))
+
+    def run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            stop, kind, args = job
+            try:
+                self.run_job(stop, kind, args)
+            except Exception as error:
+                # an error ends the job, not the thread, so the board keeps getting answers
+                self._results.put((stop, 'error', (kind,) + args, str(error) or type(error).__name__))
+
+    def run_job(self, stop, kind, args):
+        if kind == 'move':
+            self._results.put((stop, kind, args, self._game.make_move(*args)))
+        elif stop.is_set():
+            return
+        elif kind == 'moves':
+            moves = self._game.generate_all_moves(self._game.get_turn())
+            self._results.put((stop, kind, args, [end for start, end in moves if start == args[0]]))
+        elif kind == 'search':
+            self.search(stop, args[0])
+
+    def search(self, stop, depth):
+        def info(completed_depth, score, nodes, elapsed, best_move):
+            text = 'depth %d  score %d  nodes %d  best %s-%s' % (
+                completed_depth, score, nodes, self._game.convert_coordinate(best_move[0]),
+                self._game.convert_coordinate(best_move[1]))
+            self._results.put((stop, 'info', (), text))
+        Searcher(self._game).search(depth, stop, info=info)
@@ -0,0 +1,135 @@
+# Description: Validates large batches of (position, move) pairs in one call,
+# optionally split across worker processes.
+
+from concurrent.futures import ProcessPoolExecutor
+from XiangqiGame import XiangqiGame, NUM_BOARD, SHARED_PIECES, decode_position
+
+# Flags set in the result for each move
+MOVE_LEGAL = 1
+MOVE_CAPTURE = 2
+MOVE_CHECK = 4
+MOVE_MATE = 8
+
+
+class MoveValidator:
+    """
+    Checks moves against encoded positions using one scratch game for every item.
+    Positions are decoded with shared pieces, once for each run of moves on the
+    same position, and each move is undone after it's checked.
+    """
+    def __init__(self):
+        self._game = XiangqiGame(verbose=False)
+        self._has_generals = False
+
+    def load(self, position, turn):
+        """Sets the scratch game to an encoded position with turn ('RED', 'BLACK', 1 or -1) to move."""
+        board = decode_position(position)
+        pieces = set(board.values())
+        self._has_generals = SHARED_PIECES[1] in pieces and SHARED_PIECES[-1] in pieces
+        self._game.load_position(board, 'RED' if turn in ('RED', 1) else 'BLACK', update_checks=False)
+
+    def parse_square(self, square):
+        """Returns the board coordinate for an int or algebraic square. Raises ValueError if it can't be read."""
+        if isinstance(square, str):
+            if not self._game.is_algebraic(square):
+                raise ValueError('invalid square %r' % square)
+            return self._game.convert_algebraic(square)
+        # bool is an int subclass, but True isn't a square
+        if not isinstance(square, int) or isinstance(square, bool):
+            raise ValueError('invalid square %r' % (square,))
+        return square
+
+    def check_move(self, start, end):
+        """Returns the flags for moving start to end in the loaded position. Illegal moves return 0."""
+        game = self._game
+        if not self._has_generals or start not in NUM_BOARD or end not in NUM_BOARD:
+            return 0
+        board = game.get_board()
+        turn = game.get_turn()
+        piece = board[start]
+        if not piece or piece.get_color() != turn:
+            return 0
+        captured = board[end]
+        if captured and captured.get_color() == turn:
+            return 0
+        if not piece.is_valid_move(start, end, board):
+            return 0
+        flags = MOVE_LEGAL | (MOVE_CAPTURE if captured else 0)
+        enemy = 'BLACK' if turn == 'RED' else 'RED'
+        game.update_board(start, end)
+        try:
+            # can't leave your own general attacked
+            if game.attacking_squares(turn):
+                return 0
+            if game.attacking_squares(enemy):
+                flags |= MOVE_CHECK
+                if not game.find_legal_moves(enemy):
+                    flags |= MOVE_MATE
+        finally:
+            game.undo_board(start, end, captured)
+        return flags
+
+    def validate(self, positions, moves):
+        """
+        Returns a bytearray of flags, one per (position index, start, end) in moves.
+        positions maps each non-negative int index to an (encoded position, turn) pair.
+        Squares are board coordinates or algebraic notation. Sorting moves by position index
+        means each position is only decoded once. Items that can't be read,
+        or whose position can't be decoded, get flags of 0.
+        """
+        results = bytearray(len(moves))
+        loaded = None
+        for item, move in enumerate(moves):
+            try:
+                index, start, end = move
+                # negative indexes would silently count from the end of positions
+                if not isinstance(index, int) or isinstance(index, bool) or index < 0:
+                    raise ValueError('invalid position index %r' % (index,))
+                if index != loaded:
+                    loaded = index
+                    # moves on a position that fails to load are all illegal
+                    self._has_generals = False
+                    self.load(*positions[index])
+                results[item] = self.check_move(self.parse_square(start), self.parse_square(end))
+            except (TypeError, ValueError, IndexError, KeyError):
+                continue
+        return results
+
+
+# Validator reused by every chunk a worker process handles
+process_validator = None
+
+
+def validate_chunk(chunk):
+    global process_validator
+    if process_validator is None:
+        process_validator = MoveValidator()
+    positions, moves = chunk
+    return process_validator.validate(positions, moves)
+
+
+def validate_moves(positions, moves, workers=None, chunk_size=4096):
+    """
+    Validates every (position index, start, end) in moves against positions, a sequence
+    of (encoded position, turn) pairs. Returns a bytearray of MOVE_* flags per move.
+    With workers, batches larger than chunk_size are split across that many processes,
+    each chunk carrying only the positions it uses.
+    """
+    if not workers or len(moves) <= chunk_size:
+        return MoveValidator().validate(positions, moves)
+    chunks = []
+    for first in range(0, len(moves), chunk_size):
+        chunk = moves[first:first + chunk_size]
+        chunk_positions = {}
+        for move in chunk:
+            # positions that can't be found are left out, the worker flags their moves 0
+            try:
+                chunk_positions[move[0]] = positions[move[0]]
+            except (TypeError, IndexError, KeyError):
+                pass
+        chunks.append((chunk_positions, chunk))
+    results = bytearray()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for flags in executor.map(validate_chunk, chunks):
+            results += flags
+    return results
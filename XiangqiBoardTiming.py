@@ -0,0 +1,100 @@
+# Description: Times ChessBoard startup. Board timings need a display, Xvfb works:
+#   xvfb-run python XiangqiBoardTiming.py
+# Without one only the module import is timed.
+# To compare with the board before shared piece images, pass the old module:
+#   git show 90d59d4:XiangqiBoard.py > /tmp/XiangqiBoardBaseline.py
+#   xvfb-run python XiangqiBoardTiming.py --baseline /tmp/XiangqiBoardBaseline.py
+
+import argparse
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+import time
+from tkinter import Tk, TclError
+
+# Run in a fresh interpreter so nothing is imported yet, prints seconds taken to import the module at path
+IMPORT_TIMER = ('import importlib.util, sys, time\n'
+                'sys.path.insert(0, sys.argv[2])\n'
+                'started = time.perf_counter()\n'
+                'spec = importlib.util.spec_from_file_location("timed", sys.argv[1])\n'
+                'spec.loader.exec_module(importlib.util.module_from_spec(spec))\n'
+                'print(time.perf_counter() - started)')
+
+
+def load_module(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def median_ms(make_board, runs):
+    """Returns median milliseconds make_board takes to return a board, destroying each board after timing it."""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        board = make_board()
+        times.append((time.perf_counter() - started) * 1000)
+        board.main.destroy()
+    return statistics.median(times)
+
+
+def import_ms(path, runs):
+    """Returns median milliseconds to import the board module at path in a new interpreter. Needs no display."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    # an installed app imports from cached bytecode, so allow it to be written and skip the first run
+    environment = dict(os.environ)
+    environment.pop('PYTHONDONTWRITEBYTECODE', None)
+    times = []
+    for _ in range(runs + 1):
+        output = subprocess.run([sys.executable, '-c', IMPORT_TIMER, path, here], check=True,
+                                capture_output=True, text=True, env=environment).stdout
+        times.append(float(output) * 1000)
+    return statistics.median(times[1:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time ChessBoard cold start and new board latency')
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--baseline', help='path to an older XiangqiBoard.py to compare against')
+    args = parser.parse_args()
+
+    # importing the module is part of a cold start and can be timed without a display
+    results = [('import, current', import_ms(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                          'XiangqiBoard.py'), args.runs))]
+    if args.baseline:
+        results.append(('import, baseline', import_ms(args.baseline, args.runs)))
+    try:
+        Tk().destroy()
+    except TclError as error:
+        for label, milliseconds in results:
+            print('%-32s %8.1f ms' % (label, milliseconds))
+        sys.exit('board timings need a display: %s' % error)
+
+    import XiangqiBoard
+    if args.baseline:
+        baseline = load_module(args.baseline, 'XiangqiBoardBaseline')
+        # the old board always starts its own interpreter and decodes every image
+        results.append(('baseline, new Tk()', median_ms(baseline.ChessBoard, args.runs)))
+
+    # a new interpreter each time, so the image cache starts cold
+    results.append(('lazy images, new Tk()', median_ms(lambda: XiangqiBoard.ChessBoard(), args.runs)))
+    results.append(('preloaded images, new Tk()',
+                    median_ms(lambda: XiangqiBoard.ChessBoard(lazy_images=False), args.runs)))
+
+    # further boards in one interpreter reuse its decoded images
+    root = Tk()
+    root.withdraw()
+    XiangqiBoard.ChessBoard(master=root)
+    results.append(('Toplevel(master), warm cache',
+                    median_ms(lambda: XiangqiBoard.ChessBoard(master=root), args.runs)))
+    root.destroy()
+
+    for label, milliseconds in results:
+        print('%-32s %8.1f ms' % (label, milliseconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+# Description: Streams training samples from replayed Xiangqi games into
+# fixed-size shards of memory-mappable .npy files, with a JSON manifest.
+
+import json
+import os
+import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from XiangqiGame import XiangqiGame, BOARD_SQUARES
+
+# Every field is stored as signed bytes, shape is per sample.
+# positions: piece codes from XiangqiGame.encode_position
+# side: 1 if RED to move, -1 if BLACK to move
+# result: 1 if RED won, -1 if BLACK won, 0 otherwise
+# moves: start and end coordinates of the move played
+SAMPLE_FIELDS = {'positions': (len(BOARD_SQUARES),), 'side': (), 'result': (), 'moves': (2,)}
+
+RESULT_CODES = {'RED_WON': 1, 'BLACK_WON': -1}
+
+
+def replay_game(moves, result=None):
+    """
+    Replays a list of (start, end) algebraic moves through XiangqiGame.make_move
+    and yields (position, side, result, start, end) for every legal move played.
+    Replay stops at the first illegal move, including moves that can't be parsed
+    or are off the board. If result isn't given, the game state
+    reached at the end of the replay is used.
+    """
+    game = XiangqiGame(verbose=False)
+    played = []
+    for move in moves:
+        try:
+            start, end = move
+        except (TypeError, ValueError):
+            break
+        if not game.is_algebraic(start) or not game.is_algebraic(end):
+            break
+        position = game.encode_position()
+        side = 1 if game.get_turn() == 'RED' else -1
+        if not game.make_move(start, end):
+            break
+        played.append((position, side, game.convert_algebraic(start), game.convert_algebraic(end)))
+    if result is None:
+        result = game.get_game_state()
+    result = RESULT_CODES.get(result, 0)
+    for position, side, start, end in played:
+        yield position, side, result, start, end
+
+
+def iter_samples(games):
+    """
+    Yields samples from an iterable of (moves, result) pairs one game at a time,
+    so only the game being replayed is ever held in memory.
+    """
+    for moves, result in games:
+        yield from replay_game(moves, result)
+
+
+def write_npy(path, shape, data):
+    """Writes raw signed byte data to path as a version 1.0 .npy file."""
+    header = "{'descr': '|i1', 'fortran_order': False, 'shape': %r, }" % (tuple(shape),)
+    # magic string, version and header length take 10 bytes, total header is padded to 64
+    header += ' ' * (-(10 + len(header) + 1) % 64) + '\n'
+    with open(path, 'wb') as npy_file:
+        npy_file.write(b'\x93NUMPY\x01\x00')
+        npy_file.write(struct.pack('<H', len(header)))
+        npy_file.write(header.encode('latin1'))
+        npy_file.write(data)
+
+
+def write_shard(directory, index, count, buffers):
+    """Writes the first count samples in buffers as one .npy file per field and returns the manifest entry."""
+    files = {}
+    for field, sample_shape in SAMPLE_FIELDS.items():
+        name = 'shard-%05d.%s.npy' % (index, field)
+        width = 1
+        for size in sample_shape:
+            width *= size
+        write_npy(os.path.join(directory, name), (count,) + sample_shape, buffers[field][:count * width])
+        files[field] = name
+    return {'index': index, 'count': count, 'files': files}
+
+
+class ShardWriter:
+    """
+    Packs samples into preallocated shard buffers and hands full shards to a pool of
+    writer threads. At most max_pending shards are waiting to be written at once,
+    so memory use depends on shard_size and workers, not on the number of samples.
+    """
+    def __init__(self, directory, shard_size=65536, workers=1, max_pending=None):
+        self._directory = directory
+        self._shard_size = shard_size
+        self._max_pending = max_pending or 2 * workers
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._pending = deque()
+        self._shards = []
+        self._index = 0
+        self._count = 0
+        self._buffers = self.new_buffers()
+        os.makedirs(directory, exist_ok=True)
+
+    def new_buffers(self):
+        """Returns empty byte buffers sized for one full shard."""
+        buffers = {}
+        for field, sample_shape in SAMPLE_FIELDS.items():
+            width = 1
+            for size in sample_shape:
+                width *= size
+            buffers[field] = bytearray(self._shard_size * width)
+        return buffers
+
+    def add(self, sample):
+        """Adds one (position, side, result, start, end) sample, flushing the shard when it's full."""
+        position, side, result, start, end = sample
+        row = self._count
+        squares = len(BOARD_SQUARES)
+        self._buffers['positions'][row * squares:(row + 1) * squares] = bytes(code & 0xFF for code in position)
+        self._buffers['side'][row] = side & 0xFF
+        self._buffers['result'][row] = result & 0xFF
+        self._buffers['moves'][row * 2] = start
+        self._buffers['moves'][row * 2 + 1] = end
+        self._count += 1
+        if self._count == self._shard_size:
+            self.flush()
+
+    def flush(self):
+        """Sends the current shard to a writer thread and starts a new one."""
+        if not self._count:
+            return
+        # wait for the oldest shard if too many are queued
+        while len(self._pending) >= self._max_pending:
+            self._shards.append(self._pending.popleft().result())
+        self._pending.append(self._executor.submit(write_shard, self._directory, self._index,
+                                                   self._count, self._buffers))
+        self._index += 1
+        self._count = 0
+        self._buffers = self.new_buffers()
+
+    def abort(self):
+        """Waits for shards already queued and stops the writers without writing a manifest."""
+        while self._pending:
+            # wait without raising, the export is already failing
+            self._pending.popleft().exception()
+        self._executor.shutdown()
+
+    def close(self):
+        """Writes any remaining samples, waits for writers and writes manifest.json. Returns the manifest."""
+        self.flush()
+        while self._pending:
+            self._shards.append(self._pending.popleft().result())
+        self._executor.shutdown()
+        manifest = {'shard_size': self._shard_size,
+                    'fields': {field: {'dtype': '|i1', 'shape': list(shape)} for field, shape in SAMPLE_FIELDS.items()},
+                    'total_samples': sum(shard['count'] for shard in self._shards),
+                    'shards': self._shards}
+        with open(os.path.join(self._directory, 'manifest.json'), 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+        return manifest
+
+
+def export_samples(games, directory, shard_size=65536, workers=1):
+    """
+    Replays games, an iterable of (moves, result) pairs, and streams their samples
+    into shards under directory. Returns the manifest. The manifest is only
+    written once every sample has been exported, so a failed export has none.
+    """
+    writer = ShardWriter(directory, shard_size, workers)
+    try:
+        for sample in iter_samples(games):
+            writer.add(sample)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
@@ -3,6 +3,23 @@
 # Portfolio Project
 # Description: Xiangqi game simulator with move validation.
 
+import re
+from collections import OrderedDict
+from types import MappingProxyType
+
+# Small integer code for each piece type, used when a position is encoded
+# compactly. RED pieces are positive, BLACK pieces negative, empty squares 0.
+PIECE_CODES = {'General': 1, 'Advisor': 2, 'Elephant': 3, 'Horse': 4, 'Chariot': 5, 'Cannon': 6, 'Soldier': 7}
+
+# Board coordinates in the order used by encoded positions, rank by rank from RED's side.
+BOARD_SQUARES = tuple(rank * 10 + file for rank in range(10) for file in range(9))
+
+# Every coordinate on the board. Shared by all pieces, so pieces are cheap to create and copy.
+NUM_BOARD = frozenset(BOARD_SQUARES)
+
+# Algebraic square accepted by make_move, files a-i and ranks 1-10
+SQUARE_PATTERN = re.compile(r'[a-i](10|[1-9])')
+
 
 class Pieces:
     """
@@ -14,9 +31,7 @@ class Pieces:
     def __init__(self, color, piece_type):
         self._color = color
         self._type = piece_type
-        self._num_board = set()
-        for x in range(0, 100, 10):
-            self._num_board = self._num_board.union(*{range(x, x + 9)})
+        self._num_board = NUM_BOARD
 
     def get_color(self):
         """
@@ -64,11 +79,13 @@ class Soldier(Pieces):
 
     def pseudo_legal_moves(self, start, board):
         moves = set()
+        move_directions = self._move_directions
+        # once past the river soldier can also move sideways
         if self.past_river(self.get_color(), start):
-            self._move_directions.extend([1, -1])
-        for move in self._move_directions:
-            if self.in_board(start + move) and not board[start + move]\
-                    or self.get_color() != board[start + move].get_color():
+            move_directions = move_directions + [1, -1]
+        for move in move_directions:
+            if self.in_board(start + move) and (not board[start + move]
+                    or self.get_color() != board[start + move].get_color()):
                 moves.add(start + move)
         return moves
 
@@ -278,23 +295,22 @@ class Cannon(Pieces):
     def pseudo_legal_moves(self, start, board):
         moves = set()
         for move in self._move_directions:
-            pao_tai_cnt = 0
+            # pieces of either color can be the pao tai (screen)
+            pao_tai_found = False
             coord = start + move
             while self.in_board(coord):
-                if not board[coord]:
-                    moves.add(coord)
-                    coord += move
-                else:
-                    if board[coord].get_color() == board[start].get_color:
-                        if pao_tai_cnt > 0:
-                            break
+                if not pao_tai_found:
+                    # before the screen cannon moves like a chariot, but can't capture
+                    if not board[coord]:
+                        moves.add(coord)
                     else:
-                        if pao_tai_cnt == 1:
-                            moves.add(coord)
-                        pao_tai_cnt += 1
-                        if pao_tai_cnt > 1:
-                            break
-                    coord += move
+                        pao_tai_found = True
+                elif board[coord]:
+                    # after the screen the first piece reached can be captured if it's an enemy
+                    if board[coord].get_color() != self.get_color():
+                        moves.add(coord)
+                    break
+                coord += move
         return moves
 
     def is_valid_move(self, start, end, board):
@@ -353,6 +369,79 @@ class Cannon(Pieces):
         return self._blocks
 
 
+# One shared instance of each piece, keyed by piece code, for boards decoded from
+# encoded positions. Pieces don't change while moves are generated, so boards can share them.
+SHARED_PIECES = {}
+for piece_class in (General, Advisor, Elephant, Horse, Chariot, Cannon, Soldier):
+    for piece_color, sign in (('RED', 1), ('BLACK', -1)):
+        shared_piece = piece_class(piece_color)
+        SHARED_PIECES[sign * PIECE_CODES[shared_piece.get_type()]] = shared_piece
+
+
+def decode_position(position):
+    """
+    Returns a board dictionary for an encoded position, the inverse of
+    XiangqiGame.encode_position. Bytes are read as signed piece codes.
+    Raises ValueError if position isn't 90 valid piece codes.
+    """
+    if isinstance(position, (bytes, bytearray)):
+        position = memoryview(position).cast('b')
+    if len(position) != len(BOARD_SQUARES):
+        raise ValueError('position needs %d squares' % len(BOARD_SQUARES))
+    board = {}
+    for coord, code in zip(BOARD_SQUARES, position):
+        if code and code not in SHARED_PIECES:
+            raise ValueError('unknown piece code %r' % (code,))
+        board[coord] = SHARED_PIECES[code] if code else None
+    return board
+
+
+class PositionCache:
+    """
+    Least recently used cache for position queries, keyed by the kind of query,
+    the encoded position and the color asked about. Since keys hold the whole
+    position, an entry can never be returned for a board it wasn't computed on.
+    One cache can be shared by any number of games.
+    """
+    def __init__(self, max_size=10000):
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def lookup(self, key):
+        """Returns cached value for key, or None if it isn't cached."""
+        value = self._entries.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def store(self, key, value):
+        """Caches value for key, evicting least recently used entries over max_size."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self):
+        """Removes every entry and resets the hit, miss and eviction counts."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_stats(self):
+        """Returns hit, miss and eviction counts, current size and hit rate."""
+        lookups = self._hits + self._misses
+        return {'hits': self._hits, 'misses': self._misses, 'evictions': self._evictions,
+                'size': len(self._entries), 'hit_rate': self._hits / lookups if lookups else 0.0}
+
+
 class XiangqiGame:
     # PIECES
     # General: One move orthogonally, within palace, can't face other general
@@ -363,14 +452,24 @@ class XiangqiGame:
     # Chariot, any distance orthogonally, no jump
     # Soldier: One forward, until after river, then sideways too, no backward
 
-    def __init__(self):
+    def __init__(self, verbose=True, cache=None):
+        # Whether move feedback is printed
+        self._verbose = verbose
+
+        # Optional PositionCache for legal moves and attacks, and the encoded
+        # position it's keyed by. The key is reset whenever the board changes.
+        self._cache = cache
+        self._position_key = None
+
         # Whose turn it is
         self._turn = 'RED'
 
         # 'UNFINISHED' until a player is checkmated, then 'RED_WON' or 'BLACK_WON'
         self._game_state = 'UNFINISHED'
 
-        # Locations of each piece
+        # Locations of each piece. The dictionary is shared with forks of the game
+        # while _board_shared is True, and copied before either game changes it.
+        self._board_shared = False
         self._board = {0: Chariot('RED'), 1: Horse('RED'), 2: Elephant('RED'), 3: Advisor('RED'), 4: General('RED')
                        , 5: Advisor('RED'), 6: Elephant('RED'), 7: Horse('RED'), 8: Chariot('RED'), 10: None,
                        11: None, 12: None, 13: None, 14: None, 15: None, 16: None, 17: None, 18: None,
@@ -397,6 +496,43 @@ class XiangqiGame:
         # True if a general of that color is in check, else False
         self._in_check = {'RED': False, 'BLACK': False}
 
+    def log(self, *message):
+        """Prints move feedback unless the game was created with verbose=False."""
+        if self._verbose:
+            print(*message)
+
+    def get_turn(self):
+        """Returns color of player whose turn it is"""
+        return self._turn
+
+    def get_board(self):
+        """
+        Returns a read-only view of the board mapping coordinates to pieces.
+        The board may be shared with forks and is the source of the cached
+        position key, so it's only changed through update_board, undo_board,
+        set_board, restore_game and load_position.
+        """
+        return MappingProxyType(self._board)
+
+    def encode_position(self):
+        """
+        Returns the board as a tuple of 90 piece codes, one per square in
+        BOARD_SQUARES order. Positive codes are RED pieces, negative are BLACK.
+        """
+        if self._position_key is not None:
+            return self._position_key
+        encoded = []
+        for coord in BOARD_SQUARES:
+            piece = self._board[coord]
+            if not piece:
+                encoded.append(0)
+            elif piece.get_color() == 'RED':
+                encoded.append(PIECE_CODES[piece.get_type()])
+            else:
+                encoded.append(-PIECE_CODES[piece.get_type()])
+        self._position_key = tuple(encoded)
+        return self._position_key
+
     def change_turns(self):
         """Switches to other players turn."""
         if self._turn == 'BLACK':
@@ -415,6 +551,8 @@ class XiangqiGame:
 
     def restore_game(self):
         self._board = self._saved_board.copy()
+        self._board_shared = False
+        self._position_key = None
         # new_red = set()
         # new_black = set()
         # new_red = new_red.union(self._saved_pieces['RED'])
@@ -422,9 +560,32 @@ class XiangqiGame:
         # self._saved_pieces = {'RED': new_red, 'BLACK': new_black}
         self._general_location = self._saved_generals.copy()
 
+    def fork(self):
+        """
+        Returns an independent game in the same position. The two games share the
+        board, and the pieces on it, until one of them moves, so forking costs
+        the same however deep the game is and a branch only copies the board
+        once, on its first move. Forks share the game's PositionCache.
+        """
+        branch = XiangqiGame.__new__(XiangqiGame)
+        branch.__dict__.update(self.__dict__)
+        branch._general_location = self._general_location.copy()
+        branch._in_check = self._in_check.copy()
+        self._board_shared = True
+        branch._board_shared = True
+        return branch
+
+    def own_board(self):
+        """Copies the board before it's changed if it's still shared with a fork."""
+        if self._board_shared:
+            self._board = self._board.copy()
+            self._board_shared = False
+
     def set_board(self, new_board):
         """Sets board state to new_board"""
         self._board = new_board
+        self._board_shared = False
+        self._position_key = None
 
     def update_board(self, start_move_square, end_move_square):
         """
@@ -444,20 +605,62 @@ class XiangqiGame:
         #         self._pieces['RED'].remove(end_move_square)
 
 
+        self.own_board()
         # Update general location if general was piece moved
         if start_move_square == self._general_location[start_color]:
             self._general_location[start_color] = end_move_square
         self._board[end_move_square] = self._board[start_move_square]
         self._board[start_move_square] = None
+        self._position_key = None
+
+    def undo_board(self, start_move_square, end_move_square, captured):
+        """
+        Reverses update_board, putting the moved piece back on
+        start_move_square and captured, which may be None, on end_move_square.
+        """
+        self.own_board()
+        moved_color = self._board[end_move_square].get_color()
+        if end_move_square == self._general_location[moved_color]:
+            self._general_location[moved_color] = start_move_square
+        self._board[start_move_square] = self._board[end_move_square]
+        self._board[end_move_square] = captured
+        self._position_key = None
+
+    def load_position(self, board, turn, update_checks=True):
+        """
+        Sets board and player to move, locating the generals and, unless
+        update_checks is False, updating whether each color is in check.
+        Without the check scan neither color is marked in check.
+        """
+        self._board = board
+        self._board_shared = False
+        self._position_key = None
+        self._turn = turn
+        self._game_state = 'UNFINISHED'
+        self._general_location = {}
+        for coord, piece in board.items():
+            if piece and piece.get_type() == 'General':
+                self._general_location[piece.get_color()] = coord
+        self.save_game()
+        for color in ('RED', 'BLACK'):
+            self._in_check[color] = update_checks and bool(self.general_is_attacked(color))
 
     def get_game_state(self):
         """Returns game state"""
         return self._game_state
 
+    def is_algebraic(self, notation):
+        """Returns True if notation is a string naming a board square in algebraic notation"""
+        return isinstance(notation, str) and SQUARE_PATTERN.fullmatch(notation) is not None
+
     def convert_algebraic(self, notation):
         """Converts algebraic board notation to the matching integer for self._board"""
         return ord(notation[0]) - 97 + 10 * (int(notation[1:]) - 1)
 
+    def convert_coordinate(self, coordinate):
+        """Converts an integer coordinate of self._board to algebraic board notation"""
+        return chr(coordinate % 10 + 97) + str(coordinate // 10 + 1)
+
     def flying_general(self):
         """
         Returns True if generals are facing each other on same file with no intervening pieces.
@@ -476,8 +679,20 @@ class XiangqiGame:
     def general_is_attacked(self, color):
         """
         If the general of input color is being threatened by any pieces,
-        returns an array of those pieces. Otherwise returns False.
+        returns an array of those pieces. Otherwise returns an empty array.
+        Uses the game's PositionCache if it has one.
         """
+        if self._cache is None:
+            return self.attacking_squares(color)
+        key = ('attacks', self.encode_position(), color)
+        attacks = self._cache.lookup(key)
+        if attacks is None:
+            attacks = self.attacking_squares(color)
+            self._cache.store(key, tuple(attacks))
+        return list(attacks)
+
+    def attacking_squares(self, color):
+        """Returns coordinates of every piece threatening the general of input color, without caching."""
         # Opposite color of general
         enemy = 'BLACK' if color == 'RED' else 'RED'
         # array to hold coordinates from which general is being threatened
@@ -488,24 +703,40 @@ class XiangqiGame:
                 if self._board[coord].get_type() in ['General', 'Advisor', "Elephant"]:
                     continue
                 if self._board[coord].is_valid_move(coord, self._general_location[color], self._board):
-                    print('general attacked by', coord)
+                    self.log('general attacked by', coord)
                     attacks.append(coord)
         if self.flying_general():
-            print('flying general')
+            self.log('flying general')
             attacks.append(self._general_location[enemy])
         return attacks
 
     def generate_all_moves(self, color):
+        """
+        Returns every legal (start, end) move for input color. Uses the game's
+        PositionCache if it has one, which also makes repeated checkmate and
+        stalemate queries on the same position cache hits.
+        """
+        if self._cache is None:
+            return self.find_legal_moves(color)
+        key = ('moves', self.encode_position(), color)
+        legal_moves = self._cache.lookup(key)
+        if legal_moves is None:
+            legal_moves = self.find_legal_moves(color)
+            self._cache.store(key, tuple(legal_moves))
+        return list(legal_moves)
+
+    def find_legal_moves(self, color):
+        """Returns every legal (start, end) move for input color, without caching."""
         all_moves = []
         legal_moves = []
         for coord in self._board:
             if self._board[coord] and self._board[coord].get_color() == color:
                 all_moves.extend([(coord, move) for move in self._board[coord].pseudo_legal_moves(coord, self._board)])
         self.save_game()
-        print(self._saved_board)
         for move in all_moves:
             self.update_board(move[0], move[1])
-            if not self.general_is_attacked(color):
+            # candidate positions are one-offs, so they skip the cache
+            if not self.attacking_squares(color):
                 legal_moves.append(move)
             self.restore_game()
         self.restore_game()
@@ -619,35 +850,35 @@ class XiangqiGame:
         end = self.convert_algebraic(end)
         # If game is over, can't make move
         if self.get_game_state() != 'UNFINISHED':
-            print('game over')
+            self.log('game over')
             return False
         # If there isn't a piece on start square can't move
         if not self._board[start]:
-            print('no piece on that square')
+            self.log('no piece on that square')
             return False
         # If there is a piece on end square
         start_color = self._board[start].get_color()
         # If it isn't piece's color's turn, return False
 
         if start_color != self._turn:
-            print('not your turn')
+            self.log('not your turn')
             return False
         if self._board[end]:
             # If the piece is the same color as the moving piece, can't capture it
             if self._board[end].get_color() == start_color:
-                print('cant capture same color')
+                self.log('cant capture same color')
 
                 return False
         # Otherwise we're good and just need to check that piece can legally move there
         if not self._board[start].is_valid_move(start, end, self._board):
-            print('not valid move')
+            self.log('not valid move')
             return False
         # Save board. Update, then see if move puts player in check.
         self.save_game()
         self.update_board(start, end)
         # If move would put player in check, revert board state and return False
         if self.general_is_attacked(start_color):
-            print('cant put yourself in check')
+            self.log('cant put yourself in check')
             self.restore_game()
             return False
         # If general isn't attacked, can clear check.
@@ -658,10 +889,10 @@ class XiangqiGame:
         attacks = self.general_is_attacked(enemy_color)
         # Place enemy color in check if attacks array isn't empty. Check for checkmate
         if attacks:
-            print('CHECK!')
+            self.log('CHECK!')
             self._in_check[enemy_color] = True
             if self.is_checkmated(enemy_color):
-                print('CHECKMATE')
+                self.log('CHECKMATE')
                 self._game_state = start_color + '_WON'
         else:
             self._in_check[enemy_color] = False
@@ -0,0 +1,127 @@
+# Description: Headless renderer writing SVG, or optionally PNG, snapshots of
+# Xiangqi positions without Tk. Uses the same layout and piece images as ChessBoard.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from XiangqiGame import PIECE_CODES, BOARD_SQUARES
+from XiangqiImages import PIECE_IMAGE_DATA
+
+try:
+    import cairosvg
+except ImportError:
+    cairosvg = None
+
+# Layout matches XiangqiBoard.ChessBoard
+DELTA = 40
+SQUARE_SIZE = 75
+PIECE_SIZE = 51
+WIDTH = 8 * SQUARE_SIZE + DELTA
+HEIGHT = 9 * SQUARE_SIZE + DELTA + SQUARE_SIZE
+
+# Piece color and type for each code in an encoded position
+CODE_PIECES = {}
+for piece_type, code in PIECE_CODES.items():
+    CODE_PIECES[code] = ('RED', piece_type)
+    CODE_PIECES[-code] = ('BLACK', piece_type)
+
+
+def glyph_id(code):
+    color, piece_type = CODE_PIECES[code]
+    return color.lower() + '-' + piece_type.lower()
+
+
+def build_glyphs():
+    """Returns the <defs> entry for each piece code, embedding its GIF once."""
+    glyphs = {}
+    for code, piece in CODE_PIECES.items():
+        glyphs[code] = ('<image id="%s" width="%d" height="%d" href="data:image/gif;base64,%s"/>'
+                        % (glyph_id(code), PIECE_SIZE, PIECE_SIZE, PIECE_IMAGE_DATA[piece]))
+    return glyphs
+
+
+def build_grid():
+    """Returns the SVG lines for the board grid, with the files left open across the river."""
+    right = DELTA + 8 * SQUARE_SIZE
+    bottom = DELTA + 9 * SQUARE_SIZE
+    river_top = DELTA + 4 * SQUARE_SIZE
+    lines = []
+    for rank in range(10):
+        y = DELTA + rank * SQUARE_SIZE
+        lines.append('M%d %dH%d' % (DELTA, y, right))
+    for file in range(9):
+        x = DELTA + file * SQUARE_SIZE
+        lines.append('M%d %dV%d' % (x, DELTA, river_top))
+        lines.append('M%d %dV%d' % (x, river_top + SQUARE_SIZE, bottom))
+    return '<path d="%s" stroke="black" fill="none"/>' % ''.join(lines)
+
+
+# Precomputed once per process, rendering a position only fills these in.
+GLYPHS = build_glyphs()
+SVG_HEADER = ('<svg xmlns="http://www.w3.org/2000/svg" width="%%g" height="%%g" viewBox="0 0 %d %d">'
+              '<rect width="100%%%%" height="100%%%%" fill="white"/>%s' % (WIDTH, HEIGHT, build_grid()))
+# <use> element placing a piece on each square, by index in BOARD_SQUARES
+SQUARE_USES = tuple('<use href="#%%s" x="%d" y="%d"/>' % ((coord % 10) * SQUARE_SIZE, (9 - coord // 10) * SQUARE_SIZE)
+                    for coord in BOARD_SQUARES)
+
+
+def position_codes(position):
+    """Returns the piece codes of an encoded position, reading bytes as signed like decode_position."""
+    if isinstance(position, (bytes, bytearray)):
+        return memoryview(position).cast('b')
+    return position
+
+
+def render_svg(position, scale=1.0):
+    """
+    Returns SVG text for an encoded position, as returned by XiangqiGame.encode_position
+    or stored as signed bytes by XiangqiExport. scale sizes the image relative to the Tk board.
+    """
+    position = position_codes(position)
+    codes = set(code for code in position if code)
+    parts = [SVG_HEADER % (WIDTH * scale, HEIGHT * scale), '<defs>']
+    parts.extend(GLYPHS[code] for code in codes)
+    parts.append('</defs>')
+    for index, code in enumerate(position):
+        if code:
+            parts.append(SQUARE_USES[index] % glyph_id(code))
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def render_game_svg(game, scale=1.0):
+    """Returns SVG text for the current board of a XiangqiGame."""
+    return render_svg(game.encode_position(), scale)
+
+
+def write_snapshot(position, path, scale=1.0):
+    """
+    Writes position to path, as PNG if path ends in .png and SVG otherwise.
+    PNG output needs cairosvg.
+    """
+    svg = render_svg(position, scale)
+    if path.lower().endswith('.png'):
+        if cairosvg is None:
+            raise RuntimeError('PNG output needs cairosvg installed')
+        cairosvg.svg2png(bytestring=svg.encode(), write_to=path)
+    else:
+        with open(path, 'w') as svg_file:
+            svg_file.write(svg)
+    return path
+
+
+def write_snapshot_job(job):
+    return write_snapshot(*job)
+
+
+def render_batch(positions, directory, image_format='svg', scale=1.0, workers=None, chunksize=64):
+    """
+    Writes one image per (name, position) pair in positions to directory/name.image_format,
+    spreading the work over a pool of worker processes. Returns the written paths in order.
+    """
+    if image_format == 'png' and cairosvg is None:
+        raise RuntimeError('PNG output needs cairosvg installed')
+    os.makedirs(directory, exist_ok=True)
+    jobs = ((tuple(position_codes(position)), os.path.join(directory, '%s.%s' % (name, image_format)), scale)
+            for name, position in positions)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(write_snapshot_job, jobs, chunksize=chunksize))
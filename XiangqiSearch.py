@@ -0,0 +1,126 @@
+# Description: Iterative deepening alpha-beta search over XiangqiGame positions.
+
+import time
+from XiangqiGame import XiangqiGame
+
+# Material value of each piece type. Soldiers are worth more once across the river.
+PIECE_VALUES = {'General': 0, 'Advisor': 200, 'Elephant': 200, 'Horse': 400, 'Chariot': 900, 'Cannon': 450,
+                'Soldier': 100}
+CROSSED_SOLDIER_BONUS = 100
+
+# Score for being checkmated (or stalemated, which also loses in Xiangqi), less the ply it happens at.
+MATE_SCORE = 100000
+
+
+class SearchStopped(Exception):
+    """Raised inside the search when it's stopped or runs out of time or nodes."""
+
+
+class Searcher:
+    """
+    Searches a private copy of a game's position, so the game passed in is
+    never changed. Moves are (start, end) board coordinates.
+    """
+    def __init__(self, game):
+        self._game = XiangqiGame(verbose=False)
+        self._game.load_position(game.get_board().copy(), game.get_turn())
+        self._nodes = 0
+        self._stop = None
+        self._deadline = None
+        self._max_nodes = None
+        self._best_moves = {}
+
+    def get_nodes(self):
+        return self._nodes
+
+    def evaluate(self):
+        """Returns material balance from the point of view of the player to move."""
+        score = 0
+        board = self._game.get_board()
+        for coord in board:
+            piece = board[coord]
+            if not piece:
+                continue
+            value = PIECE_VALUES[piece.get_type()]
+            if piece.get_type() == 'Soldier' and piece.past_river(piece.get_color(), coord):
+                value += CROSSED_SOLDIER_BONUS
+            score += value if piece.get_color() == 'RED' else -value
+        return score if self._game.get_turn() == 'RED' else -score
+
+    def ordered_moves(self, ply):
+        """Legal moves for the player to move, best move from the last iteration first, then captures."""
+        board = self._game.get_board()
+        moves = self._game.generate_all_moves(self._game.get_turn())
+
+        def priority(move):
+            if move == self._best_moves.get(ply):
+                return -1000000
+            if board[move[1]]:
+                return -PIECE_VALUES[board[move[1]].get_type()] - 1
+            return 0
+        moves.sort(key=priority)
+        return moves
+
+    def check_limits(self):
+        if self._stop is not None and self._stop.is_set():
+            raise SearchStopped
+        if self._max_nodes is not None and self._nodes >= self._max_nodes:
+            raise SearchStopped
+        if self._deadline is not None and not self._nodes % 256 and time.monotonic() >= self._deadline:
+            raise SearchStopped
+
+    def negamax(self, depth, ply, alpha, beta):
+        """Returns score of the position for the player to move, searched to depth."""
+        self._nodes += 1
+        self.check_limits()
+        if depth == 0:
+            return self.evaluate()
+        moves = self.ordered_moves(ply)
+        if not moves:
+            return -MATE_SCORE + ply
+        for start, end in moves:
+            captured = self._game.get_board()[end]
+            self._game.update_board(start, end)
+            self._game.change_turns()
+            try:
+                score = -self.negamax(depth - 1, ply + 1, -beta, -alpha)
+            finally:
+                self._game.change_turns()
+                self._game.undo_board(start, end, captured)
+            if score > alpha:
+                alpha = score
+                self._best_moves[ply] = (start, end)
+                if alpha >= beta:
+                    break
+        return alpha
+
+    def search(self, max_depth=None, stop=None, movetime=None, max_nodes=None, info=None):
+        """
+        Searches with increasing depth until max_depth is reached, stop (a threading.Event)
+        is set, movetime seconds pass or max_nodes are searched. info, if given, is called
+        with (depth, score, nodes, elapsed, best_move) after each completed depth.
+        Returns the best move found, or None if there are no legal moves.
+        """
+        self._nodes = 0
+        self._stop = stop
+        self._max_nodes = max_nodes
+        started = time.monotonic()
+        self._deadline = started + movetime if movetime is not None else None
+        root_moves = self._game.generate_all_moves(self._game.get_turn())
+        if not root_moves:
+            return None
+        best_move = root_moves[0]
+        depth = 0
+        while max_depth is None or depth < max_depth:
+            depth += 1
+            try:
+                score = self.negamax(depth, 0, -MATE_SCORE - 1, MATE_SCORE + 1)
+            except SearchStopped:
+                break
+            best_move = self._best_moves.get(0, best_move)
+            if info is not None:
+                info(depth, score, self._nodes, time.monotonic() - started, best_move)
+            # a forced mate has been found, searching deeper won't change it
+            if abs(score) >= MATE_SCORE - depth:
+                break
+        return best_move
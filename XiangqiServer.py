@@ -0,0 +1,212 @@
+# Description: Asyncio server hosting many concurrent Xiangqi games over a
+# newline-delimited JSON protocol on TCP or a Unix socket.
+#
+# Each request is one JSON object per line, answered by one JSON object per line:
+#   {"cmd": "new"}                                          -> {"ok": true, "session": "..."}
+#   {"cmd": "make_move", "session": "...", "start": "b3", "end": "e3"}
+#                                                           -> {"ok": true, "legal": true, "state": {...}}
+#   {"cmd": "legal_moves", "session": "..."}                -> {"ok": true, "moves": [["a1", "a2"], ...]}
+#   {"cmd": "state", "session": "..."}                      -> {"ok": true, "state": {...}}
+#   {"cmd": "close", "session": "..."}                      -> {"ok": true}
+# Failures answer {"ok": false, "error": "..."}. An "id" field in a request is echoed back.
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from XiangqiGame import XiangqiGame
+
+
+def apply_move(game, start, end):
+    """
+    Runs make_move in a worker, including any checkmate evaluation,
+    and returns the result with the updated game.
+    """
+    return game.make_move(start, end), game
+
+
+def legal_moves(game):
+    """Returns legal moves for the side to move in algebraic notation."""
+    return [[game.convert_coordinate(start), game.convert_coordinate(end)]
+            for start, end in game.generate_all_moves(game.get_turn())]
+
+
+def game_state(game):
+    """Returns a JSON friendly summary of game."""
+    return {'turn': game.get_turn(),
+            'game_state': game.get_game_state(),
+            'in_check': {'RED': game.is_in_check('RED'), 'BLACK': game.is_in_check('BLACK')},
+            'position': list(game.encode_position())}
+
+
+async def read_request_line(reader):
+    """
+    Returns the next line from reader, or what's left at end of input. A line over
+    the stream limit is skipped up to and including its newline, so the next read
+    starts at the next request, and then ValueError is raised.
+    """
+    try:
+        return await reader.readuntil(b'\n')
+    except asyncio.IncompleteReadError as error:
+        return error.partial
+    except asyncio.LimitOverrunError as error:
+        consumed = error.consumed
+    while True:
+        # the first consumed bytes in the buffer belong to the long line
+        await reader.readexactly(consumed)
+        try:
+            await reader.readuntil(b'\n')
+        except asyncio.LimitOverrunError as error:
+            consumed = error.consumed
+        else:
+            raise ValueError('request line too long')
+
+
+class Session:
+    """One hosted game. Commands for a session run one at a time."""
+    def __init__(self):
+        self.game = XiangqiGame(verbose=False)
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+
+
+class XiangqiServer:
+    """
+    Hosts sessions keyed by id. Rule checks that may evaluate checkmate run in
+    a process pool so the event loop never waits on them. Sessions unused for
+    idle_timeout seconds are evicted.
+    """
+    def __init__(self, workers=None, idle_timeout=600, max_sessions=100000):
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._idle_timeout = idle_timeout
+        self._max_sessions = max_sessions
+        # least recently used session first
+        self._sessions = OrderedDict()
+        self._evictor = None
+
+    def get_session(self, session_id):
+        """Returns session for session_id, marking it as recently used."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise ValueError('unknown session')
+        session.last_used = time.monotonic()
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def evict_idle(self):
+        """Removes sessions idle longer than idle_timeout. Returns number removed."""
+        cutoff = time.monotonic() - self._idle_timeout
+        evicted = 0
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session.last_used > cutoff:
+                break
+            del self._sessions[session_id]
+            evicted += 1
+        return evicted
+
+    async def evict_loop(self):
+        while True:
+            await asyncio.sleep(self._idle_timeout / 4)
+            self.evict_idle()
+
+    async def handle_command(self, request):
+        """Runs one decoded request and returns the response dictionary."""
+        command = request.get('cmd')
+        if command == 'new':
+            self.evict_idle()
+            if len(self._sessions) >= self._max_sessions:
+                raise RuntimeError('too many sessions')
+            session_id = uuid.uuid4().hex
+            self._sessions[session_id] = Session()
+            return {'ok': True, 'session': session_id}
+
+        session_id = request.get('session')
+        session = self.get_session(session_id)
+        loop = asyncio.get_running_loop()
+        async with session.lock:
+            if command == 'make_move':
+                start = request.get('start')
+                end = request.get('end')
+                # bad squares are answered here rather than failing in a worker
+                for square in (start, end):
+                    if not session.game.is_algebraic(square):
+                        raise ValueError('invalid square %r, expected a1 to i10' % (square,))
+                legal, game = await loop.run_in_executor(self._executor, apply_move, session.game, start, end)
+                # session may have been closed while the worker ran
+                if session_id in self._sessions:
+                    session.game = game
+                return {'ok': True, 'legal': legal, 'state': game_state(game)}
+            if command == 'legal_moves':
+                moves = await loop.run_in_executor(self._executor, legal_moves, session.game)
+                return {'ok': True, 'moves': moves}
+            if command == 'state':
+                return {'ok': True, 'state': game_state(session.game)}
+            if command == 'close':
+                self._sessions.pop(session_id, None)
+                return {'ok': True}
+        raise ValueError('unknown command')
+
+    async def handle_client(self, reader, writer):
+        """Answers each request line from one connection in order."""
+        try:
+            while True:
+                request = {}
+                try:
+                    line = await read_request_line(reader)
+                except ValueError as error:
+                    response = {'ok': False, 'error': str(error)}
+                else:
+                    if not line:
+                        break
+                    if not line.strip():
+                        continue
+                    try:
+                        request = json.loads(line)
+                        if not isinstance(request, dict):
+                            raise ValueError('request must be a JSON object')
+                        response = await self.handle_command(request)
+                    except Exception as error:
+                        # any failure answers this request, the connection stays open
+                        response = {'ok': False, 'error': str(error) or type(error).__name__}
+                if isinstance(request, dict) and 'id' in request:
+                    response['id'] = request['id']
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8765, path=None):
+        """Serves on a Unix socket at path if given, otherwise on TCP host and port."""
+        if path:
+            server = await asyncio.start_unix_server(self.handle_client, path=path)
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port)
+        self._evictor = asyncio.create_task(self.evict_loop())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self._evictor.cancel()
+            self._executor.shutdown(cancel_futures=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Xiangqi multi-session game server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='serve on this Unix socket path instead of TCP')
+    parser.add_argument('--workers', type=int, help='rule check worker processes')
+    parser.add_argument('--idle-timeout', type=float, default=600, help='seconds before idle sessions are evicted')
+    args = parser.parse_args()
+    server = XiangqiServer(args.workers, args.idle_timeout)
+    asyncio.run(server.serve(args.host, args.port, args.unix))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+# Description: UCCI protocol driver for XiangqiGame over stdin/stdout.
+# Commands are read on the main thread while searches run in a background
+# thread, so stop, isready and quit are answered straight away.
+
+import re
+import sys
+import threading
+from XiangqiGame import XiangqiGame, Soldier, General, Advisor, Chariot, Elephant, Horse, Cannon
+from XiangqiSearch import Searcher
+
+# UCCI move, files a-i and ranks 0-9 for the start and end squares
+MOVE_PATTERN = re.compile(r'[a-i][0-9][a-i][0-9]')
+
+START_FEN = 'rnbakabnr/9/1c5c1/p1p1p1p1p/9/9/P1P1P1P1P/1C5C1/9/RNBAKABNR w - - 0 1'
+
+# FEN letters for each piece class. Upper case is RED, lower case BLACK.
+FEN_PIECES = {'k': General, 'a': Advisor, 'b': Elephant, 'e': Elephant, 'n': Horse, 'h': Horse, 'r': Chariot,
+              'c': Cannon, 'p': Soldier}
+
+
+def board_from_fen(fen):
+    """
+    Returns (board, turn) for the placement and side to move fields of a FEN string.
+    FEN lists ranks from BLACK's back rank down to RED's.
+    """
+    fields = fen.split()
+    board = {rank * 10 + file: None for rank in range(10) for file in range(9)}
+    rows = fields[0].split('/')
+    if len(rows) != 10:
+        raise ValueError('FEN needs 10 ranks')
+    for row_index, row in enumerate(rows):
+        rank = 9 - row_index
+        file = 0
+        for letter in row:
+            if letter.isdigit():
+                file += int(letter)
+                continue
+            if letter.lower() not in FEN_PIECES or file > 8:
+                raise ValueError('bad FEN rank ' + row)
+            board[rank * 10 + file] = FEN_PIECES[letter.lower()]('RED' if letter.isupper() else 'BLACK')
+            file += 1
+    generals = [piece.get_color() for piece in board.values() if piece and piece.get_type() == 'General']
+    if sorted(generals) != ['BLACK', 'RED']:
+        raise ValueError('FEN needs one general of each color')
+    turn = 'BLACK' if len(fields) > 1 and fields[1] == 'b' else 'RED'
+    return board, turn
+
+
+def ucci_to_algebraic(square):
+    """Converts a UCCI square (ranks 0-9) to the algebraic notation make_move takes (ranks 1-10)."""
+    return square[0] + str(int(square[1]) + 1)
+
+
+def coordinate_to_ucci(coordinate):
+    """Converts an integer board coordinate to a UCCI square."""
+    return chr(coordinate % 10 + 97) + str(coordinate // 10)
+
+
+class UcciEngine:
+    def __init__(self, output=sys.stdout):
+        self._output = output
+        self._output_lock = threading.Lock()
+        self._game = None
+        self._fen = None
+        self._moves = []
+        self._search_thread = None
+        self._stop = threading.Event()
+        self.set_position(START_FEN, [])
+
+    def send(self, line):
+        """Writes one protocol line. Called from both the command and search threads."""
+        with self._output_lock:
+            self._output.write(line + '\n')
+            self._output.flush()
+
+    def set_position(self, fen, moves):
+        """
+        Sets the position to fen followed by moves. If fen matches the last position and
+        moves extend the last move list, only the new moves are applied.
+        """
+        if fen != self._fen or moves[:len(self._moves)] != self._moves:
+            # only replace the current position once the new one has loaded
+            board, turn = board_from_fen(fen)
+            game = XiangqiGame(verbose=False)
+            game.load_position(board, turn)
+            self._game = game
+            self._fen = fen
+            self._moves = []
+        for move in moves[len(self._moves):]:
+            if not MOVE_PATTERN.fullmatch(move) \
+                    or not self._game.make_move(ucci_to_algebraic(move[:2]), ucci_to_algebraic(move[2:4])):
+                self.send('info string illegal move ' + move)
+                break
+            self._moves.append(move)
+
+    def report(self, depth, score, nodes, elapsed, best_move):
+        # mate scores are sent as is, MATE_SCORE less the plies to mate, which GUIs read as a mate distance
+        nps = int(nodes / elapsed) if elapsed > 0 else nodes
+        self.send('info depth %d score %d nodes %d nps %d time %d pv %s'
+                  % (depth, score, nodes, nps, int(elapsed * 1000),
+                     coordinate_to_ucci(best_move[0]) + coordinate_to_ucci(best_move[1])))
+
+    def run_search(self, searcher, max_depth, movetime, max_nodes):
+        try:
+            best_move = searcher.search(max_depth, self._stop, movetime, max_nodes, self.report)
+        except Exception as error:
+            self.send('info string search failed: %s' % (str(error) or type(error).__name__))
+            best_move = None
+        if best_move is None:
+            self.send('nobestmove')
+        else:
+            self.send('bestmove ' + coordinate_to_ucci(best_move[0]) + coordinate_to_ucci(best_move[1]))
+
+    def start_search(self, arguments):
+        """Starts a search in the background for a go command's arguments."""
+        self.stop_search()
+        max_depth = None
+        movetime = None
+        max_nodes = None
+        options = {}
+        for index, word in enumerate(arguments[:-1]):
+            if arguments[index + 1].isdigit():
+                options[word] = int(arguments[index + 1])
+        if 'depth' in options:
+            max_depth = options['depth']
+        if 'nodes' in options:
+            max_nodes = options['nodes']
+        if 'time' in options:
+            # time left in milliseconds, spread over the moves to go or an estimated 30 more moves
+            movetime = options['time'] / 1000 / max(options.get('movestogo', 30), 1)
+            movetime += options.get('increment', 0) / 1000
+        if 'infinite' in arguments:
+            max_depth = movetime = max_nodes = None
+        self._stop.clear()
+        try:
+            searcher = Searcher(self._game)
+        except Exception as error:
+            # a bad position mustn't end the engine, the GUI still expects an answer to go
+            self.send('info string search failed: %s' % (str(error) or type(error).__name__))
+            self.send('nobestmove')
+            return
+        self._search_thread = threading.Thread(target=self.run_search,
+                                               args=(searcher, max_depth, movetime, max_nodes),
+                                               daemon=True)
+        self._search_thread.start()
+
+    def stop_search(self):
+        """Stops any running search and waits for it to report its best move."""
+        if self._search_thread is not None:
+            self._stop.set()
+            self._search_thread.join()
+            self._search_thread = None
+
+    def handle(self, line):
+        """Handles one command line. Returns False once quit is received."""
+        words = line.split()
+        if not words:
+            return True
+        command = words[0]
+        if command == 'ucci':
+            self.send('id name XiangqiGame')
+            self.send('id author Griffin Hurley')
+            self.send('ucciok')
+        elif command == 'isready':
+            self.send('readyok')
+        elif command == 'position':
+            self.stop_search()
+            if 'moves' in words:
+                moves = words[words.index('moves') + 1:]
+                words = words[:words.index('moves')]
+            else:
+                moves = []
+            if len(words) > 1 and words[1] == 'startpos':
+                fen = START_FEN
+            else:
+                fen = ' '.join(words[2:] if len(words) > 1 and words[1] == 'fen' else words[1:])
+            try:
+                self.set_position(fen, moves)
+            except (ValueError, IndexError, KeyError):
+                self.send('info string bad position')
+        elif command == 'go':
+            self.start_search(words[1:])
+        elif command == 'stop':
+            self.stop_search()
+        elif command == 'quit':
+            self.stop_search()
+            self.send('bye')
+            return False
+        return True
+
+    def run(self, lines=sys.stdin):
+        """Reads commands until quit or end of input."""
+        for line in lines:
+            if not self.handle(line):
+                break
+        self.stop_search()
+
+
+if __name__ == '__main__':
+    UcciEngine().run()
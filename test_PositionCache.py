@@ -0,0 +1,78 @@
+# Description: Regression tests for PositionCache and the cached XiangqiGame queries.
+
+import random
+import unittest
+from XiangqiGame import XiangqiGame, PositionCache
+
+
+def play_random_moves(game, count, seed):
+    """Makes up to count random legal moves and returns them."""
+    rng = random.Random(seed)
+    played = []
+    for _ in range(count):
+        moves = game.generate_all_moves(game.get_turn())
+        if not moves or game.get_game_state() != 'UNFINISHED':
+            break
+        start, end = rng.choice(sorted(moves))
+        assert game.make_move(game.convert_coordinate(start), game.convert_coordinate(end))
+        played.append((start, end))
+    return played
+
+
+def assert_same_answers(test, cached, uncached):
+    """Checks cached and uncached give the same legal moves and attacks for both colors."""
+    for color in ('RED', 'BLACK'):
+        test.assertEqual(sorted(cached.generate_all_moves(color)), sorted(uncached.generate_all_moves(color)))
+        test.assertEqual(sorted(cached.general_is_attacked(color)), sorted(uncached.general_is_attacked(color)))
+
+
+class PositionCacheTest(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = PositionCache(max_size=2)
+        cache.store('a', 1)
+        cache.store('b', 2)
+        self.assertEqual(cache.lookup('a'), 1)
+        cache.store('c', 3)
+        self.assertIsNone(cache.lookup('b'))
+        self.assertEqual(cache.lookup('a'), 1)
+        self.assertEqual(cache.lookup('c'), 3)
+        self.assertEqual(cache.get_stats()['evictions'], 1)
+
+    def test_clear_resets_stats(self):
+        cache = PositionCache(max_size=1)
+        cache.store('a', 1)
+        cache.store('b', 2)
+        cache.lookup('a')
+        cache.lookup('b')
+        cache.clear()
+        self.assertEqual(cache.get_stats(), {'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'hit_rate': 0.0})
+        cache.store('a', 1)
+        cache.lookup('a')
+        self.assertEqual(cache.get_stats()['hit_rate'], 1.0)
+
+    def test_cached_queries_match_uncached_across_moves(self):
+        # small enough that entries are evicted during the game
+        cache = PositionCache(max_size=8)
+        cached = XiangqiGame(verbose=False, cache=cache)
+        uncached = XiangqiGame(verbose=False)
+        for start, end in play_random_moves(XiangqiGame(verbose=False), 40, seed=4):
+            assert_same_answers(self, cached, uncached)
+            # asking twice must give the same answer from the cache
+            assert_same_answers(self, cached, uncached)
+            self.assertTrue(cached.make_move(cached.convert_coordinate(start), cached.convert_coordinate(end)))
+            self.assertTrue(uncached.make_move(uncached.convert_coordinate(start), uncached.convert_coordinate(end)))
+        assert_same_answers(self, cached, uncached)
+        stats = cache.get_stats()
+        self.assertGreater(stats['hits'], 0)
+        self.assertGreater(stats['evictions'], 0)
+        self.assertLessEqual(stats['size'], 8)
+
+    def test_returned_lists_do_not_change_the_cache(self):
+        game = XiangqiGame(verbose=False, cache=PositionCache())
+        moves = game.generate_all_moves('RED')
+        moves.clear()
+        self.assertEqual(len(game.generate_all_moves('RED')), 44)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+# Description: Tests for the AnalysisWorker used by analysis boards. These don't need a display.
+
+import time
+import unittest
+from XiangqiGame import XiangqiGame
+from XiangqiAnalysis import AnalysisWorker
+
+
+class AnalysisWorkerTest(unittest.TestCase):
+    def setUp(self):
+        self.game = XiangqiGame(verbose=False)
+        self.worker = AnalysisWorker(self.game)
+
+    def tearDown(self):
+        self.worker.close()
+
+    def wait_for(self, count):
+        """Returns the first count results the worker finishes, failing after 30 seconds."""
+        finished = []
+        deadline = time.monotonic() + 30
+        while len(finished) < count:
+            self.assertLess(time.monotonic(), deadline, 'worker stopped answering')
+            finished.extend(self.worker.results())
+            time.sleep(0.01)
+        return finished
+
+    def test_moves_and_move_jobs(self):
+        self.worker.submit('moves', 21)
+        kind, args, targets = self.wait_for(1)[0]
+        self.assertEqual((kind, args), ('moves', (21,)))
+        self.assertEqual(sorted(targets), [11, 20, 22, 23, 24, 25, 26, 31, 41, 51, 61, 91])
+        self.worker.submit('move', 'b3', 'e3')
+        self.assertEqual(self.wait_for(1), [('move', ('b3', 'e3'), True)])
+        self.assertEqual(self.game.get_turn(), 'BLACK')
+
+    def test_failed_job_is_reported_and_worker_keeps_running(self):
+        self.worker.submit('move', 'z9', 'a1')
+        self.worker.submit('moves', 21)
+        failed, answered = self.wait_for(2)
+        self.assertEqual(failed, ('error', ('move', 'z9', 'a1'), '105'))
+        self.assertEqual(answered[0], 'moves')
+        # errors from moves are kept even after the analysis is cancelled
+        self.worker.submit('move', 'z9', 'a1')
+        self.worker.cancel()
+        self.assertEqual(self.wait_for(1)[0][0], 'error')
+
+    def test_cancelled_analysis_is_dropped(self):
+        self.worker.submit('search', 30)
+        self.worker.cancel()
+        self.worker.submit('moves', 27)
+        for kind, args, result in self.wait_for(1):
+            self.assertEqual(kind, 'moves')
+
+
+if __name__ == '__main__':
+    unittest.main()
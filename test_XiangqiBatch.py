@@ -0,0 +1,82 @@
+# Description: Tests batched move validation against XiangqiGame.make_move.
+
+import random
+import unittest
+from XiangqiGame import XiangqiGame, BOARD_SQUARES
+from XiangqiBatch import validate_moves, MOVE_LEGAL, MOVE_CAPTURE, MOVE_CHECK, MOVE_MATE
+from test_PositionCache import play_random_moves
+
+
+def expected_flags(game, start, end):
+    """Returns the flags for start to end worked out by playing it with make_move on a fork of game."""
+    branch = game.fork()
+    captured = branch.get_board()[end]
+    enemy = 'BLACK' if game.get_turn() == 'RED' else 'RED'
+    if not branch.make_move(branch.convert_coordinate(start), branch.convert_coordinate(end)):
+        return 0
+    flags = MOVE_LEGAL | (MOVE_CAPTURE if captured else 0)
+    if branch.is_in_check(enemy):
+        flags |= MOVE_CHECK
+    if branch.get_game_state() != 'UNFINISHED':
+        flags |= MOVE_MATE
+    return flags
+
+
+def sample_positions(games, length):
+    """Returns (game, (encoded position, turn)) for every position reached in random games."""
+    samples = []
+    for seed in range(games):
+        game = XiangqiGame(verbose=False)
+        rng = random.Random(seed)
+        for _ in range(length):
+            samples.append((game.fork(), (game.encode_position(), game.get_turn())))
+            if not play_random_moves(game, 1, rng.random()):
+                break
+    return samples
+
+
+class ValidateMovesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.samples = sample_positions(4, 30)
+        cls.positions = [position for game, position in cls.samples]
+        rng = random.Random(5)
+        cls.moves = []
+        for index, (game, position) in enumerate(cls.samples):
+            board = game.get_board()
+            for start in BOARD_SQUARES:
+                if board[start]:
+                    # every pseudo legal move, for either color, plus a few squares it can't reach
+                    ends = set(board[start].pseudo_legal_moves(start, board)) | set(rng.sample(BOARD_SQUARES, 3))
+                    cls.moves.extend((index, start, end) for end in sorted(ends))
+
+    def test_flags_match_make_move(self):
+        flags = validate_moves(self.positions, self.moves)
+        expected = bytearray(expected_flags(self.samples[index][0], start, end) for index, start, end in self.moves)
+        self.assertEqual(flags, expected)
+        self.assertTrue(any(flag & MOVE_CHECK for flag in flags))
+        self.assertTrue(any(flag & MOVE_CAPTURE for flag in flags))
+
+    def test_chunks_match_one_validator(self):
+        self.assertEqual(validate_moves(self.positions, self.moves, workers=2, chunk_size=500),
+                         validate_moves(self.positions, self.moves))
+
+    def test_mate_is_flagged(self):
+        # RED chariots on a9 and b1 against a lone BLACK general on e10, b1-b10 is mate
+        position = [0] * len(BOARD_SQUARES)
+        for coord, code in ((3, 1), (80, 5), (1, 5), (94, -1)):
+            position[BOARD_SQUARES.index(coord)] = code
+        flags = validate_moves([(tuple(position), 'RED')], [(0, 'b1', 'b10'), (0, 'a9', 'a10'), (0, 'b1', 'b2')])
+        self.assertEqual(list(flags), [MOVE_LEGAL | MOVE_CHECK | MOVE_MATE, MOVE_LEGAL | MOVE_CHECK, MOVE_LEGAL])
+
+    def test_unreadable_items_are_illegal(self):
+        position = XiangqiGame(verbose=False).encode_position()
+        positions = [(position, 'RED'), (position[:10], 'RED'), (bytes(90), 'RED')]
+        moves = [(0, 'b3', 'e3'), (-1, 'b3', 'e3'), (True, 'b3', 'e3'), (0.0, 'b3', 'e3'), (3, 'b3', 'e3'),
+                 (1, 'b3', 'e3'), (2, 'b3', 'e3'), (0, True, 'a2'), (0, 'b3', 'e11'), (0, None, 'e3'),
+                 (0, 21, 24), (0, 'b3'), None, (0, 'b3', 'e3')]
+        self.assertEqual(list(validate_moves(positions, moves)), [MOVE_LEGAL] + [0] * 9 + [MOVE_LEGAL, 0, 0, MOVE_LEGAL])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# Description: Tests for exporting replayed games to sharded .npy files.
+
+import ast
+import json
+import os
+import struct
+import tempfile
+import unittest
+from XiangqiGame import XiangqiGame, BOARD_SQUARES
+from XiangqiExport import replay_game, export_samples, write_npy
+
+OPENING = [('b3', 'e3'), ('h10', 'g8'), ('h1', 'g3'), ('i10', 'h10'), ('i1', 'h1')]
+
+
+def read_npy(path):
+    """Returns the header dictionary, header size and data of a version 1.0 .npy file."""
+    with open(path, 'rb') as npy_file:
+        content = npy_file.read()
+    assert content[:8] == b'\x93NUMPY\x01\x00'
+    header_length = struct.unpack('<H', content[8:10])[0]
+    return ast.literal_eval(content[10:10 + header_length].decode('latin1')), 10 + header_length, content[10 + header_length:]
+
+
+class ReplayTest(unittest.TestCase):
+    def test_samples_follow_the_game(self):
+        samples = list(replay_game(OPENING, 'BLACK_WON'))
+        self.assertEqual(len(samples), 5)
+        game = XiangqiGame(verbose=False)
+        for (position, side, result, start, end), (move_start, move_end) in zip(samples, OPENING):
+            self.assertEqual(position, game.encode_position())
+            self.assertEqual(side, 1 if game.get_turn() == 'RED' else -1)
+            self.assertEqual(result, -1)
+            self.assertEqual((start, end), (game.convert_algebraic(move_start), game.convert_algebraic(move_end)))
+            game.make_move(move_start, move_end)
+
+    def test_replay_stops_at_first_bad_move(self):
+        for bad_move in (('b3', 'b11'), ('b3',), None, ('b3', 5), ('a1', 'a5')):
+            samples = list(replay_game(OPENING[:2] + [bad_move] + OPENING[2:]))
+            self.assertEqual(len(samples), 2)
+            self.assertEqual(samples[0][2], 0)
+
+
+class ExportTest(unittest.TestCase):
+    def test_write_npy_header(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.npy')
+            write_npy(path, (3, 2), bytes([1, 255, 2, 254, 3, 253]))
+            header, data_start, data = read_npy(path)
+        self.assertEqual(header, {'descr': '|i1', 'fortran_order': False, 'shape': (3, 2)})
+        self.assertEqual(data_start % 64, 0)
+        self.assertEqual(data, bytes([1, 255, 2, 254, 3, 253]))
+
+    def test_export_shards(self):
+        games = [(OPENING, 'RED_WON'), (OPENING[:2], None), ([], None), (OPENING[:4], 'BLACK_WON')]
+        with tempfile.TemporaryDirectory() as directory:
+            manifest = export_samples(games, directory, shard_size=4, workers=2)
+            with open(os.path.join(directory, 'manifest.json')) as manifest_file:
+                self.assertEqual(json.load(manifest_file), manifest)
+            self.assertEqual(manifest['total_samples'], 11)
+            self.assertEqual([shard['count'] for shard in manifest['shards']], [4, 4, 3])
+            self.assertEqual(manifest['fields']['positions'], {'dtype': '|i1', 'shape': [len(BOARD_SQUARES)]})
+            last = manifest['shards'][-1]['files']
+            header, _, positions = read_npy(os.path.join(directory, last['positions']))
+            self.assertEqual(header['shape'], (3, len(BOARD_SQUARES)))
+            self.assertEqual(len(positions), 3 * len(BOARD_SQUARES))
+            # the last shard holds moves two to four of the last game, starting with BLACK to move
+            game = XiangqiGame(verbose=False)
+            game.make_move('b3', 'e3')
+            first = struct.unpack('%db' % len(BOARD_SQUARES), positions[:len(BOARD_SQUARES)])
+            self.assertEqual(first, game.encode_position())
+            self.assertEqual(read_npy(os.path.join(directory, last['side']))[2], bytes([255, 1, 255]))
+            self.assertEqual(read_npy(os.path.join(directory, last['result']))[2], bytes([255] * 3))
+            self.assertEqual(read_npy(os.path.join(directory, last['moves']))[2], bytes([97, 76, 7, 26, 98, 97]))
+
+    def test_failed_export_writes_no_manifest(self):
+        def games():
+            yield OPENING, 'RED_WON'
+            yield OPENING, 'RED_WON'
+            raise RuntimeError('source failed')
+
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(RuntimeError):
+                export_samples(games(), directory, shard_size=4)
+            self.assertFalse(os.path.exists(os.path.join(directory, 'manifest.json')))
+            # shards already full were still written completely
+            self.assertEqual(len([name for name in os.listdir(directory) if name.startswith('shard-00001.')]), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
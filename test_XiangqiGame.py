@@ -0,0 +1,142 @@
+# Description: Regression tests for XiangqiGame move rules and forking.
+
+import unittest
+from XiangqiGame import XiangqiGame, PositionCache, Cannon, Chariot, General, Soldier, decode_position
+from test_PositionCache import assert_same_answers, play_random_moves
+
+
+def game_with(pieces, turn='RED'):
+    """Returns a game with only the generals on d1 and f10, plus pieces, a dict of algebraic square to piece."""
+    game = XiangqiGame(verbose=False)
+    board = {rank * 10 + file: None for rank in range(10) for file in range(9)}
+    board[3] = General('RED')
+    board[95] = General('BLACK')
+    for square, piece in pieces.items():
+        board[game.convert_algebraic(square)] = piece
+    game.load_position(board, turn)
+    return game
+
+
+class CannonTest(unittest.TestCase):
+    def cannon_moves(self, game, square):
+        moves = game.get_board()[game.convert_algebraic(square)].pseudo_legal_moves(game.convert_algebraic(square),
+                                                                                    game.get_board())
+        return {game.convert_coordinate(coord) for coord in moves}
+
+    def test_moves_like_chariot_before_the_screen(self):
+        game = game_with({'b3': Cannon('RED'), 'b6': Soldier('BLACK')})
+        self.assertEqual(self.cannon_moves(game, 'b3'),
+                         {'a3', 'c3', 'd3', 'e3', 'f3', 'g3', 'h3', 'i3', 'b1', 'b2', 'b4', 'b5'})
+        # the piece next along the file has no screen in front of it
+        self.assertFalse(game.make_move('b3', 'b6'))
+
+    def test_cannot_move_to_empty_square_past_screen(self):
+        game = game_with({'b3': Cannon('RED'), 'b5': Soldier('BLACK'), 'b9': Chariot('BLACK')})
+        moves = self.cannon_moves(game, 'b3')
+        self.assertIn('b9', moves)
+        for square in ('b6', 'b7', 'b8', 'b10'):
+            self.assertNotIn(square, moves)
+        self.assertFalse(game.make_move('b3', 'b7'))
+        self.assertTrue(game.make_move('b3', 'b9'))
+
+    def test_cannot_capture_own_piece(self):
+        game = game_with({'b3': Cannon('RED'), 'b5': Soldier('BLACK'), 'b8': Chariot('RED')})
+        self.assertNotIn('b8', self.cannon_moves(game, 'b3'))
+        self.assertFalse(game.make_move('b3', 'b8'))
+        self.assertIsNotNone(game.get_board()[game.convert_algebraic('b8')])
+
+    def test_own_piece_is_a_screen(self):
+        game = game_with({'b3': Cannon('RED'), 'b5': Soldier('RED'), 'b8': Chariot('BLACK')})
+        moves = self.cannon_moves(game, 'b3')
+        self.assertIn('b8', moves)
+        self.assertNotIn('b6', moves)
+        self.assertTrue(game.make_move('b3', 'b8'))
+
+    def test_cannon_checks_through_a_screen(self):
+        game = game_with({'f3': Cannon('RED'), 'f6': Soldier('RED')}, turn='BLACK')
+        self.assertEqual(game.general_is_attacked('BLACK'), [game.convert_algebraic('f3')])
+
+
+class LoadPositionTest(unittest.TestCase):
+    def test_check_state_is_reset_without_check_scan(self):
+        game = XiangqiGame(verbose=False)
+        start = game.encode_position()
+        for move in (('b3', 'e3'), ('h8', 'e8'), ('e3', 'e7')):
+            self.assertTrue(game.make_move(*move))
+        self.assertTrue(game.is_in_check('BLACK'))
+        game.load_position(decode_position(start), 'RED', update_checks=False)
+        self.assertFalse(game.is_in_check('BLACK'))
+        self.assertFalse(game.is_checkmated('RED'))
+        self.assertTrue(game.make_move('b3', 'e3'))
+
+    def test_check_state_is_found_with_check_scan(self):
+        game = game_with({'f3': Chariot('RED')}, turn='BLACK')
+        self.assertTrue(game.is_in_check('BLACK'))
+        self.assertFalse(game.is_in_check('RED'))
+
+
+class ForkTest(unittest.TestCase):
+    def test_branch_moves_leave_parent_and_siblings_unchanged(self):
+        parent = XiangqiGame(verbose=False)
+        opening = play_random_moves(parent, 6, seed=1)
+        position = parent.encode_position()
+        turn = parent.get_turn()
+        first = parent.fork()
+        second = parent.fork()
+
+        play_random_moves(first, 10, seed=2)
+        self.assertNotEqual(first.encode_position(), position)
+        self.assertEqual(parent.encode_position(), position)
+        self.assertEqual(second.encode_position(), position)
+        self.assertEqual(parent.get_turn(), turn)
+        self.assertEqual(second.get_turn(), turn)
+
+        play_random_moves(parent, 4, seed=3)
+        self.assertEqual(second.encode_position(), position)
+        # second still plays like a fresh game replaying the opening
+        replayed = XiangqiGame(verbose=False)
+        for start, end in opening:
+            replayed.make_move(replayed.convert_coordinate(start), replayed.convert_coordinate(end))
+        self.assertEqual(sorted(second.generate_all_moves(turn)), sorted(replayed.generate_all_moves(turn)))
+
+    def test_general_moves_stay_in_branch(self):
+        parent = XiangqiGame(verbose=False)
+        branch = parent.fork()
+        self.assertTrue(branch.make_move('e1', 'e2'))
+        self.assertTrue(branch.make_move('e10', 'e9'))
+        # flying general and attack checks use each game's own general location
+        self.assertEqual(parent.general_is_attacked('RED'), [])
+        self.assertIsNotNone(parent.get_board()[4])
+        self.assertIsNone(branch.get_board()[4])
+        self.assertTrue(parent.make_move('b3', 'e3'))
+        self.assertIsNotNone(branch.get_board()[21])
+
+    def test_fork_of_fork_is_isolated(self):
+        parent = XiangqiGame(verbose=False)
+        child = parent.fork()
+        grandchild = child.fork()
+        self.assertTrue(grandchild.make_move('b3', 'e3'))
+        self.assertIsNotNone(parent.get_board()[21])
+        self.assertIsNotNone(child.get_board()[21])
+        self.assertEqual(parent.encode_position(), child.encode_position())
+
+    def test_forks_sharing_a_cache_get_their_own_answers(self):
+        cache = PositionCache()
+        parent = XiangqiGame(verbose=False, cache=cache)
+        parent.generate_all_moves('BLACK')
+        branch = parent.fork()
+        self.assertTrue(branch.make_move('b3', 'e3'))
+        uncached_parent = XiangqiGame(verbose=False)
+        uncached_branch = XiangqiGame(verbose=False)
+        uncached_branch.make_move('b3', 'e3')
+        assert_same_answers(self, parent, uncached_parent)
+        assert_same_answers(self, branch, uncached_branch)
+
+    def test_board_view_is_read_only(self):
+        game = XiangqiGame(verbose=False)
+        with self.assertRaises(TypeError):
+            game.get_board()[40] = game.get_board()[0]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# Description: Tests for the headless SVG renderer.
+
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ElementTree
+import XiangqiRender
+from XiangqiGame import XiangqiGame, BOARD_SQUARES
+from XiangqiRender import render_svg, render_game_svg, write_snapshot, render_batch
+
+SVG = '{http://www.w3.org/2000/svg}'
+
+
+def parse(svg):
+    """Returns the root element and the (href, x, y) of every piece placed in svg."""
+    root = ElementTree.fromstring(svg)
+    uses = {(use.get('href'), int(use.get('x')), int(use.get('y'))) for use in root.iter(SVG + 'use')}
+    return root, uses
+
+
+def generals_only():
+    """Returns an encoded position with just the RED general on e1 and BLACK general on d10."""
+    position = [0] * len(BOARD_SQUARES)
+    position[BOARD_SQUARES.index(4)] = 1
+    position[BOARD_SQUARES.index(93)] = -1
+    return tuple(position)
+
+
+class RenderTest(unittest.TestCase):
+    def test_starting_position(self):
+        root, uses = parse(render_game_svg(XiangqiGame(verbose=False)))
+        self.assertEqual(root.get('viewBox'), '0 0 640 790')
+        self.assertEqual(len(uses), 32)
+        self.assertEqual(len(list(root.iter(SVG + 'image'))), 14)
+        self.assertIn(('#red-general', 300, 675), uses)
+        self.assertIn(('#black-general', 300, 0), uses)
+        self.assertIn(('#red-cannon', 75, 525), uses)
+        self.assertIn(('#black-soldier', 600, 225), uses)
+
+    def test_only_pieces_on_the_board_are_embedded(self):
+        root, uses = parse(render_svg(generals_only(), scale=0.5))
+        self.assertEqual(uses, {('#red-general', 300, 675), ('#black-general', 225, 0)})
+        self.assertEqual({image.get('id') for image in root.iter(SVG + 'image')}, {'red-general', 'black-general'})
+        self.assertEqual((root.get('width'), root.get('height')), ('320', '395'))
+
+    def test_bytes_positions_are_signed(self):
+        position = XiangqiGame(verbose=False).encode_position()
+        signed = bytes(code & 0xFF for code in position)
+        self.assertEqual(render_svg(signed), render_svg(position))
+        self.assertEqual(render_svg(bytearray(signed)), render_svg(position))
+
+    def test_write_snapshot_and_batch(self):
+        position = XiangqiGame(verbose=False).encode_position()
+        with tempfile.TemporaryDirectory() as directory:
+            path = write_snapshot(position, os.path.join(directory, 'start.svg'))
+            with open(path) as svg_file:
+                self.assertEqual(svg_file.read(), render_svg(position))
+            paths = render_batch([('start', bytes(code & 0xFF for code in position)), ('generals', generals_only())],
+                                 os.path.join(directory, 'batch'), workers=1)
+            self.assertEqual([os.path.basename(path) for path in paths], ['start.svg', 'generals.svg'])
+            with open(paths[0]) as svg_file:
+                self.assertEqual(svg_file.read(), render_svg(position))
+
+    @unittest.skipIf(XiangqiRender.cairosvg is not None, 'cairosvg is installed')
+    def test_png_needs_cairosvg(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(RuntimeError):
+                write_snapshot(generals_only(), os.path.join(directory, 'board.png'))
+            with self.assertRaises(RuntimeError):
+                render_batch([], directory, image_format='png')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# Description: Tests for XiangqiServer request handling over a local TCP connection.
+
+import asyncio
+import json
+import unittest
+from XiangqiServer import XiangqiServer
+
+
+class ServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = XiangqiServer(workers=1)
+        self.listener = await asyncio.start_server(self.server.handle_client, '127.0.0.1', 0)
+        port = self.listener.sockets[0].getsockname()[1]
+        self.reader, self.writer = await asyncio.open_connection('127.0.0.1', port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        self.listener.close()
+        await self.listener.wait_closed()
+        self.server._executor.shutdown()
+
+    async def send(self, request):
+        """Sends request, a dictionary or raw bytes, as one line and returns the decoded reply."""
+        line = request if isinstance(request, bytes) else json.dumps(request).encode()
+        self.writer.write(line + b'\n')
+        await self.writer.drain()
+        return json.loads(await asyncio.wait_for(self.reader.readline(), 30))
+
+    async def new_session(self):
+        response = await self.send({'cmd': 'new'})
+        self.assertTrue(response['ok'])
+        return response['session']
+
+    async def test_moves_are_played_in_a_session(self):
+        session = await self.new_session()
+        response = await self.send({'cmd': 'make_move', 'session': session, 'start': 'b3', 'end': 'e3', 'id': 7})
+        self.assertEqual(response['id'], 7)
+        self.assertTrue(response['legal'])
+        self.assertEqual(response['state']['turn'], 'BLACK')
+        response = await self.send({'cmd': 'make_move', 'session': session, 'start': 'a1', 'end': 'a3'})
+        self.assertTrue(response['ok'])
+        self.assertFalse(response['legal'])
+        response = await self.send({'cmd': 'legal_moves', 'session': session})
+        self.assertIn(['b10', 'c8'], response['moves'])
+
+    async def test_invalid_squares_are_rejected(self):
+        session = await self.new_session()
+        for square in ('f11', '', 'j1', 5, None):
+            response = await self.send({'cmd': 'make_move', 'session': session, 'start': square, 'end': 'e3',
+                                        'id': 'move'})
+            self.assertEqual(response, {'ok': False, 'error': 'invalid square %r, expected a1 to i10' % (square,),
+                                        'id': 'move'})
+        response = await self.send({'cmd': 'state', 'session': session})
+        self.assertEqual(response['state']['turn'], 'RED')
+
+    async def test_bad_requests_get_one_error_reply_each(self):
+        self.assertEqual(await self.send({'cmd': 'state', 'session': 'missing', 'id': 1}),
+                         {'ok': False, 'error': 'unknown session', 'id': 1})
+        session = await self.new_session()
+        self.assertEqual(await self.send({'cmd': 'undo', 'session': session}),
+                         {'ok': False, 'error': 'unknown command'})
+        self.assertEqual(await self.send(b'[1, 2]'), {'ok': False, 'error': 'request must be a JSON object'})
+        response = await self.send(b'{"cmd": ')
+        self.assertFalse(response['ok'])
+        # the connection still answers after every failure
+        self.assertTrue((await self.send({'cmd': 'state', 'session': session}))['ok'])
+
+    async def test_long_line_gets_one_reply(self):
+        for size in (70000, 200000):
+            response = await self.send({'cmd': 'new', 'id': 1, 'padding': 'x' * size})
+            self.assertEqual(response, {'ok': False, 'error': 'request line too long'})
+            response = await self.send({'cmd': 'new', 'id': 2})
+            self.assertTrue(response['ok'])
+            self.assertEqual(response['id'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# Description: Tests for the UCCI engine's position handling and search output.
+
+import io
+import unittest
+from XiangqiUcci import UcciEngine, START_FEN
+
+MATE_IN_ONE_FEN = '4k4/R8/9/9/9/9/9/9/9/1R1K5 w - - 0 1'
+
+
+class UcciEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.output = io.StringIO()
+        self.engine = UcciEngine(self.output)
+
+    def lines(self):
+        return self.output.getvalue().splitlines()
+
+    def search(self, command):
+        """Runs a go command to completion and returns the lines it sent."""
+        self.output.truncate(0)
+        self.output.seek(0)
+        self.engine.handle(command)
+        if self.engine._search_thread is not None:
+            self.engine._search_thread.join()
+        return self.lines()
+
+    def test_new_moves_are_applied_to_the_same_game(self):
+        self.engine.handle('position startpos moves h2e2')
+        game = self.engine._game
+        self.engine.handle('position startpos moves h2e2 h9g7')
+        self.assertIs(self.engine._game, game)
+        self.assertEqual(game.get_turn(), 'RED')
+        self.assertIsNotNone(game.get_board()[76])
+        # a different history starts again from the FEN
+        self.engine.handle('position startpos moves b2e2')
+        self.assertIsNot(self.engine._game, game)
+        self.assertEqual(self.engine._game.get_turn(), 'BLACK')
+
+    def test_failed_position_keeps_the_old_one(self):
+        self.engine.handle('position startpos moves h2e2')
+        game = self.engine._game
+        position = game.encode_position()
+        for command in ('position fen 4k4/9/9/9/9/9/9/9/9/9 w - - 0 1', 'position fen rnbakabnr/9 w',
+                        'position fen 4k4/9/9/9/9/9/9/9/9/3X5 w'):
+            self.engine.handle(command)
+            self.assertEqual(self.lines()[-1], 'info string bad position')
+            self.assertIs(self.engine._game, game)
+            self.assertEqual(game.encode_position(), position)
+
+    def test_illegal_moves_stop_the_move_list(self):
+        self.engine.handle('position startpos moves h2e2 zz99 h9g7')
+        self.assertEqual(self.lines()[-1], 'info string illegal move zz99')
+        self.assertEqual(self.engine._game.get_turn(), 'BLACK')
+        self.engine.handle('position startpos moves h2e2 a9a5')
+        self.assertEqual(self.lines()[-1], 'info string illegal move a9a5')
+
+    def test_search_sends_bestmove(self):
+        lines = self.search('go depth 1')
+        self.assertTrue(lines[0].startswith('info depth 1 score '))
+        self.assertTrue(lines[-1].startswith('bestmove '))
+
+    def test_mate_is_reported_as_a_score(self):
+        self.engine.handle('position fen ' + MATE_IN_ONE_FEN)
+        lines = self.search('go depth 4')
+        self.assertIn('info depth 2 score 99999 ', lines[-2])
+        self.assertEqual(lines[-1], 'bestmove b0b9')
+
+    def test_position_without_moves_sends_nobestmove(self):
+        self.engine.handle('position fen 3k5/4R4/4R4/9/9/9/9/9/9/4K4 b - - 0 1')
+        self.assertEqual(self.search('go depth 2'), ['nobestmove'])
+
+    def test_quit(self):
+        self.assertFalse(self.engine.handle('quit'))
+        self.assertEqual(self.lines()[-1], 'bye')
+        self.assertEqual(self.engine._fen, START_FEN)
+
+
+if __name__ == '__main__':
+    unittest.main()